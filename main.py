@@ -1,5 +1,6 @@
 import os
 import sys
+import multiprocessing
 from PySide6.QtWidgets import (
     QApplication, QWidget, QHBoxLayout, QVBoxLayout,
     QPushButton, QStackedWidget
@@ -105,7 +106,7 @@ class MainWindow(QWidget):
         # -----------------------------
         # 공통 로딩 오버레이
         # -----------------------------
-        self.overlay = LoadingOverlay(self)
+        self.overlay = LoadingOverlay.instance(self)
 
         # overlay 전달
         if hasattr(self.page_dataset, "set_overlay"):
@@ -163,4 +164,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 학습은 spawn 자식 프로세스에서 실행됨 (Windows exe 빌드 대응)
+    multiprocessing.freeze_support()
     main()
@@ -4,7 +4,7 @@ import cv2
 import numpy as np
 import json
 
-from PySide6.QtCore import QThread, Signal, Qt
+from PySide6.QtCore import QThread, Signal, Qt, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QPixmap, QImage
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog,
@@ -13,6 +13,8 @@ from PySide6.QtWidgets import (
 
 from ultralytics import YOLO
 
+from utils.json_io import save_json
+
 
 # ====================================
 #   실시간 YOLO Predict Worker
@@ -57,14 +59,78 @@ class PredictWorker(QThread):
             "conf": self.conf
         }
         try:
-            with open(os.path.join(self.save_dir, "predict_metadata.json"), "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=4, ensure_ascii=False)
+            save_json(os.path.join(self.save_dir, "predict_metadata.json"), metadata)
         except Exception as e:
             self.log_signal.emit(f"❌ metadata 저장 실패: {e}")
 
         self.finished_ok.emit(final_dir)
 
 
+# ====================================
+#   history metadata 스캔 (QThreadPool에서 실행)
+#   - 네트워크 드라이브 등에서 느려도 UI 스레드가 멈추지 않도록
+# ====================================
+def scan_history_models(history_dir: str):
+    """
+    history/*/metadata.json을 읽어
+    (dataset별 모델 파일 목록, 모델 파일 → {dataset, timestamp}, 최신 timestamp) 반환
+    """
+    grouped = {"fire": [], "human": [], "etc": [], "unknown": []}
+    metadata_map = {}
+    timestamps = []
+
+    for folder in os.listdir(history_dir):
+        meta_path = os.path.join(history_dir, folder, "metadata.json")
+        if not os.path.isfile(meta_path):
+            continue
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except:
+            continue
+
+        model_file = os.path.basename(meta.get("models_file") or "")
+        if not model_file:
+            continue
+        dataset = meta.get("dataset", "unknown")
+        timestamp = meta.get("timestamp")
+
+        metadata_map[model_file] = {
+            "dataset": dataset,
+            "timestamp": timestamp
+        }
+        timestamps.append(timestamp)
+
+        if dataset not in grouped:
+            grouped["etc"].append(model_file)
+        else:
+            grouped[dataset].append(model_file)
+
+    latest = max(timestamps) if timestamps else None
+    return grouped, metadata_map, latest
+
+
+class _ModelScanSignals(QObject):
+    # (요청 번호, scan_history_models 결과)
+    finished = Signal(int, object)
+
+
+class ModelScanTask(QRunnable):
+    def __init__(self, history_dir: str, gen: int, signals: _ModelScanSignals):
+        super().__init__()
+        self.history_dir = history_dir
+        self.gen = gen
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = scan_history_models(self.history_dir)
+        except OSError:
+            result = None
+        self.signals.finished.emit(self.gen, result)
+
+
 # ====================================
 #   Predict Page
 # ====================================
@@ -78,6 +144,11 @@ class PredictPage(QWidget):
         self.latest_train_timestamp = None
         self.selected_path = None
 
+        # 모델 목록 스캔은 백그라운드에서, 늦게 도착한 이전 결과는 gen으로 걸러냄
+        self._scan_gen = 0
+        self._scan_signals = _ModelScanSignals(self)
+        self._scan_signals.finished.connect(self._on_models_scanned)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
 
@@ -163,6 +234,7 @@ class PredictPage(QWidget):
     # Dataset별 모델 분류 + 최신순 정렬 + 최신 모델 강조
     # =======================================================
     def refresh_model_list(self, _=None):
+        self._scan_gen += 1
         self.model_combo.clear()
         models_dir = self.paths.get("models_dir", "")
         history_dir = self.paths.get("history_dir", "")
@@ -170,43 +242,17 @@ class PredictPage(QWidget):
         if not os.path.isdir(models_dir) or not os.path.isdir(history_dir):
             return
 
-        # metadata 기반 모델 목록 구성
-        grouped = {"fire": [], "human": [], "etc": [], "unknown": []}
-        metadata_map = {}
-        timestamps = []
-
-        for folder in os.listdir(history_dir):
-            meta_path = os.path.join(history_dir, folder, "metadata.json")
-            if not os.path.isfile(meta_path):
-                continue
+        # metadata 기반 모델 목록 구성 → _on_models_scanned
+        QThreadPool.globalInstance().start(
+            ModelScanTask(history_dir, self._scan_gen, self._scan_signals)
+        )
 
-            try:
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-            except:
-                continue
+    def _on_models_scanned(self, gen: int, result):
+        if gen != self._scan_gen or result is None:
+            return
 
-            dataset = meta.get("dataset", "unknown")
-            model_file = os.path.basename(meta.get("models_file"))
-            timestamp = meta.get("timestamp")
-
-            metadata_map[model_file] = {
-                "dataset": dataset,
-                "timestamp": timestamp
-            }
-            timestamps.append(timestamp)
-
-            if dataset not in grouped:
-                grouped["etc"].append(model_file)
-            else:
-                grouped[dataset].append(model_file)
-
-        # 최신 timestamp 찾기
-        if timestamps:
-            timestamps.sort(reverse=True)
-            self.latest_train_timestamp = timestamps[0]
-        else:
-            self.latest_train_timestamp = None
+        grouped, metadata_map, self.latest_train_timestamp = result
+        self.model_combo.clear()
 
         # ---------------------------------------------------
         # QComboBox 구성
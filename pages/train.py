@@ -1,21 +1,38 @@
 import os
 import shutil
-import json
 import datetime
 import sys
-import io
 import time
-import re  # 🔥 Epoch 로그 파싱용
-
-from PySide6.QtCore import QThread, Signal, Qt
+import functools
+import re  # data.yaml 스캔용
+import collections
+import mmap
+import queue
+import atexit
+import multiprocessing as mp
+
+from PySide6.QtCore import QThread, Signal, Qt, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton,
     QHBoxLayout, QComboBox, QLineEdit, QFileDialog,
-    QTextEdit, QProgressBar
+    QTextEdit, QProgressBar, QCheckBox
 )
 
 from ultralytics import YOLO
 
+from utils.json_io import save_json
+
+try:
+    import torch
+    _HAS_TORCH = True
+except ImportError:
+    torch = None
+    _HAS_TORCH = False
+
+# ETA 계산용 Epoch 소요시간 EWMA 가중치
+_ETA_ALPHA = 0.3
+
+
 
 # ======================================================
 # 🔧 시간 포맷 헬퍼 (mm:ss / hh:mm:ss)
@@ -29,7 +46,12 @@ def format_time(sec: float | int | None) -> str:
         return "-"
     if sec < 0:
         sec = 0
-    sec = int(sec)
+    return _format_seconds(int(sec))
+
+
+# 진행률 표시 시 같은 초 값이 반복되므로 정수 초 단위로 캐시
+@functools.lru_cache(maxsize=4096)
+def _format_seconds(sec: int) -> str:
     h = sec // 3600
     m = (sec % 3600) // 60
     s = sec % 60
@@ -39,24 +61,189 @@ def format_time(sec: float | int | None) -> str:
         return f"{m:02d}:{s:02d}"
 
 
+# ======================================================
+# 🔧 학습 결과에서 mAP50 꺼내기 (버전별 위치가 달라 순서대로 시도)
+# ======================================================
+_MAP50_ATTR_PATHS = (
+    ("metrics", "map50"),
+    ("metrics", "box", "map50"),
+)
+
+
+def get_map50(res):
+    # 예외 대신 getattr 기본값으로 탐색
+    for path in _MAP50_ATTR_PATHS:
+        val = res
+        for name in path:
+            val = getattr(val, name, None)
+            if val is None:
+                break
+        if val is not None:
+            return float(val)
+
+    d = getattr(res, "results_dict", None) or {}
+    val = d.get("metrics/mAP50(B)")
+    return float(val) if val is not None else None
+
+
+# ======================================================
+# 🔧 학습 Device 선택 (cuda → mps → cpu), 프로세스당 1회만 확인
+# ======================================================
+@functools.lru_cache(maxsize=1)
+def pick_device() -> str:
+    if not _HAS_TORCH:
+        return "cpu"
+    if torch.cuda.is_available():
+        return "0"
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+# ======================================================
+# 🔧 best.pt 복제 헬퍼
+#   - 같은 파일시스템: 하드링크 (데이터 복사 없음)
+#   - btrfs/xfs: reflink (FICLONE)
+#   - Linux: copy_file_range (커널 내부 복사)
+#   - Windows: CopyFileW (OS 복사 엔진)
+#   - 그 외: shutil.copyfile (Linux에선 내부적으로 sendfile 사용)
+#   - dst는 직접 열지 않고 dst.tmp에 만든 뒤 os.replace로 교체
+#     (하드링크로 공유 중인 inode를 덮어쓰거나 반쯤 쓴 파일이 남지 않도록)
+# ======================================================
+_FICLONE = 0x40049409
+
+
+def _fastcopy(src: str, dst: str):
+    # 이미 같은 파일(하드링크)이면 할 일 없음
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return
+
+    tmp = dst + ".tmp"
+    try:
+        if os.path.lexists(tmp):
+            os.remove(tmp)  # 이전에 중단된 복사 잔여물
+        _copy_to_new(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _copy_to_new(src: str, dst: str):
+    # dst는 아직 없는 새 경로여야 함
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    if sys.platform.startswith("linux"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                import fcntl
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                return
+            except OSError:
+                pass
+
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+                if remaining == 0:
+                    return
+            except OSError:
+                pass
+
+    elif os.name == "nt":
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileW(src, dst, False):
+            return
+
+    shutil.copyfile(src, dst)
+
+
+# ======================================================
+# 🔧 기본 YOLO 가중치 캐시
+#   - models_dir/base/ 아래에 한 번만 받아두고 경로를 재사용
+#   - CWD에 이미 있는 파일은 다운로드 없이 링크/복사
+# ======================================================
+@functools.lru_cache(maxsize=8)
+def _resolve_base_weights(model_name: str, models_dir: str) -> str:
+    base_dir = os.path.join(models_dir, "base")
+    cached = os.path.join(base_dir, model_name)
+    # 비어 있는 파일은 캐시로 인정하지 않음 (이전 버전에서 중단된 복사 잔여물)
+    if os.path.isfile(cached) and os.path.getsize(cached) > 0:
+        return cached
+
+    from ultralytics.utils.downloads import attempt_download_asset
+    src = attempt_download_asset(model_name)  # 로컬에 없으면 다운로드
+
+    os.makedirs(base_dir, exist_ok=True)
+    # _fastcopy는 임시 파일 + os.replace라서 중간에 끊겨도 cached 경로엔 완성본만 생김
+    _fastcopy(str(src), cached)
+    return cached
+
+
 # ======================================================
 # 🔥 데이터셋 자동 판별 (fire / human)
 #   - 지금은 "기본값 제안" 용도로만 사용
 # ======================================================
 def detect_dataset_from_yaml(yaml_path: str) -> str:
     """
-    data.yaml 내부의 폴더명을 기준으로 데이터셋을 자동 판별
-      - fire → train/val 경로에 fire 문자열 포함
+    data.yaml 내용을 기준으로 데이터셋을 자동 판별
+      - fire → fire 문자열 포함
       - human → human 문자열 포함
     기본값: unknown
+    (path, mtime) 기준으로 캐시 → 같은 파일을 다시 골라도 재스캔하지 않음
+    YOLO_TRAINER_STRICT_YAML 환경변수가 있으면 YAML 파싱 후 train/val 경로만 검사
     """
+    try:
+        mtime = os.path.getmtime(yaml_path)
+    except OSError:
+        return "unknown"
+    return _detect_dataset_cached(yaml_path, mtime)
+
+
+_FIRE_RE = re.compile(rb"fire", re.IGNORECASE)
+_HUMAN_RE = re.compile(rb"human", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=128)
+def _detect_dataset_cached(yaml_path: str, mtime: float) -> str:
     if not os.path.isfile(yaml_path):
         return "unknown"
 
+    if os.environ.get("YOLO_TRAINER_STRICT_YAML"):
+        return _detect_dataset_strict(yaml_path)
+
+    # YAML 파서 없이 파일 전체를 mmap으로 훑어서 문자열만 확인
+    try:
+        with open(yaml_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _FIRE_RE.search(mm):
+                    return "fire"
+                if _HUMAN_RE.search(mm):
+                    return "human"
+    except (OSError, ValueError):  # 빈 파일은 mmap 불가
+        pass
+
+    return "unknown"
+
+
+def _detect_dataset_strict(yaml_path: str) -> str:
     try:
         import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml 있으면 C 로더
         with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=loader)
 
         train_path = str(data.get("train", "")).lower()
         val_path = str(data.get("val", "")).lower()
@@ -73,8 +260,94 @@ def detect_dataset_from_yaml(yaml_path: str) -> str:
     return "unknown"
 
 
+# ======================================================
+# 🔧 학습 자식 프로세스
+#   - GUI 프로세스의 GIL/Qt 이벤트 루프와 분리해서 YOLO 학습 실행
+#   - 로그/Epoch/결과는 Queue 메시지로 부모(TrainWorker)에 전달
+#       ("log", text) / ("epoch", ep, total) / ("tick",) / ("batch", n)
+#       ("done", map50) / ("error", msg)
+# ======================================================
+# Epoch 종료 시 로그에 표시할 검증 지표 (표시 이름, trainer.metrics 키)
+_METRIC_KEYS = (
+    ("P", "metrics/precision(B)"),
+    ("R", "metrics/recall(B)"),
+    ("mAP50", "metrics/mAP50(B)"),
+    ("mAP50-95", "metrics/mAP50-95(B)"),
+)
+
+
+def _train_entry(weights: str, train_kwargs: dict, q):
+    if train_kwargs.get("device") == "0" and _HAS_TORCH:
+        # 🔥 Ampere 이상 GPU: FP32 matmul/conv를 TF32 Tensor Core로 처리
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+
+    put = q.put
+    last_tick = [0.0]
+
+    # 첫 배치 전 준비 단계(라벨 스캔/캐시, AMP 체크, AutoBatch)도 몇 분 걸릴 수 있으므로 상태 전달
+    def on_pretrain_start(trainer):
+        put(("log", "🔧 데이터셋 스캔 / 모델 준비 중..."))
+        put(("tick",))
+
+    def on_pretrain_end(trainer):
+        # AutoBatch(batch=-1)가 정한 실제 batch 크기도 여기서 확정됨
+        put(("batch", trainer.batch_size))
+        put(("log", "✔ 학습 준비 완료"))
+        put(("tick",))
+
+    def on_train_start(trainer):
+        put(("log", "🚀 학습 루프 시작"))
+        put(("tick",))
+
+    def on_epoch_start(trainer):
+        put(("epoch", trainer.epoch + 1, trainer.epochs))
+
+    def on_batch_end(trainer):
+        # 배치마다 보내면 너무 많으므로 0.5초에 한 번만 (경과시간 표시용)
+        now = time.monotonic()
+        if now - last_tick[0] >= 0.5:
+            last_tick[0] = now
+            put(("tick",))
+
+    def on_epoch_end(trainer):
+        losses = trainer.label_loss_items(trainer.tloss, prefix="train") or {}
+        text = "  ".join(f"{k.split('/')[-1]} {float(v):.4f}" for k, v in losses.items())
+        put(("log", f"Epoch {trainer.epoch + 1}/{trainer.epochs} | {text}"))
+
+    def on_fit_epoch_end(trainer):
+        m = trainer.metrics or {}
+        put(("log", "  └ " + "  ".join(
+            f"{label} {float(m.get(key, 0.0)):.4f}" for label, key in _METRIC_KEYS
+        )))
+
+    try:
+        model = YOLO(weights)
+        # stdout 가로채기 대신 trainer 콜백에서 구조화된 로그/진행 정보 전달
+        model.add_callback("on_pretrain_routine_start", on_pretrain_start)
+        model.add_callback("on_pretrain_routine_end", on_pretrain_end)
+        model.add_callback("on_train_start", on_train_start)
+        model.add_callback("on_train_epoch_start", on_epoch_start)
+        model.add_callback("on_train_batch_end", on_batch_end)
+        model.add_callback("on_train_epoch_end", on_epoch_end)
+        model.add_callback("on_fit_epoch_end", on_fit_epoch_end)
+        results = model.train(**train_kwargs)
+    except Exception as e:
+        put(("error", str(e)))
+        return
+
+    put(("done", get_map50(results)))
+
+
+def _terminate_if_alive(proc):
+    # GUI 종료 시 학습 프로세스가 남아 GPU를 잡고 있지 않도록
+    if proc.is_alive():
+        proc.terminate()
+
+
 # ======================================================
 # 학습 Worker Thread
+#   - 자식 프로세스를 띄우고 Queue 메시지를 시그널로 중계
 # ======================================================
 class TrainWorker(QThread):
     log_signal = Signal(str)
@@ -84,7 +357,8 @@ class TrainWorker(QThread):
     # elapsed_sec, expected_total_sec, current_epoch, total_epochs
     progress_signal = Signal(float, float, int, int)
 
-    def __init__(self, model_name, data_yaml, epochs, patience, paths: dict, dataset_name="unknown"):
+    def __init__(self, model_name, data_yaml, epochs, patience, paths: dict, dataset_name="unknown",
+                 use_amp=True, imgsz=640, batch=8):
         super().__init__()
         self.model_name = model_name
         self.data_yaml = data_yaml
@@ -92,106 +366,131 @@ class TrainWorker(QThread):
         self.patience = patience
         self.paths = paths
         self.dataset_name = dataset_name   # fire / human / etc / unknown
+        self.use_amp = use_amp             # AMP(Mixed Precision) 사용 여부
+        self.imgsz = imgsz
+        self.batch = batch                 # -1 → Ultralytics auto-batch (GPU 메모리 기준)
+
+        # 학습 로그 링버퍼 (TrainPage가 타이머로 주기적으로 비움)
+        self._log_buf: collections.deque[str] = collections.deque(maxlen=4096)
 
         # ---- 진행률/ETA 계산용 내부 상태 ----
         self._start_time: float | None = None        # 학습 전체 시작 시각
-        self._prepare_end_time: float | None = None  # 이미지 스캔/준비 끝난 시각 (Epoch 1 시작 근처)
-        self._epoch1_end_time: float | None = None   # Epoch 1 종료 시각 (Epoch 2 로그 등장 시점)
+        self._epoch_start_time: float | None = None  # 현재 Epoch 시작 시각
+        self._epoch_ewma: float | None = None        # Epoch 소요시간 EWMA (초)
         self._expected_total_time: float | None = None  # 예상 총 학습시간 (초)
-        self._first_epoch_seen_time: float | None = None
         self.current_epoch: int = 0
         self.total_epochs: int = epochs
+        self._last_emit_ts: float = 0.0               # 마지막 progress_signal 발행 시각
+        self._last_emitted: tuple[int, int] = (-1, -1)  # 마지막으로 보낸 (퍼센트, Epoch)
+
+        # 자주 호출되는 emit은 bound method로 미리 잡아둠
+        self._emit_progress_sig = self.progress_signal.emit
 
     # --------------------------------------------------
-    # 🔥 로그 한 줄이 들어올 때마다 호출되는 헬퍼
-    #   - Epoch 파싱
-    #   - 준비/1에포크 시간 측정
-    #   - 예상 총 학습시간 계산
-    #   - 진행률 시그널 전송
+    # 🔥 로그가 들어올 때마다 호출 → 경과시간 기준 진행률 갱신
     # --------------------------------------------------
-    def _handle_log_line(self, line: str):
-        now = time.time()
+    def _on_log_written(self):
+        now = time.monotonic()
 
         # 최초 로그 시각 = 전체 학습 시작 시각으로 사용
         if self._start_time is None:
             self._start_time = now
 
-        # "  1/30 " 이런 형식의 Epoch 로그 파싱
-        m = re.search(r"^\s*(\d+)/(\d+)\s", line)
-        if m:
-            ep = int(m.group(1))
-            total = int(m.group(2))
-            # 총 Epoch 정보 업데이트 (YOLO 설정과 다를 일은 거의 없지만 방어용)
-            if total > 0:
-                self.total_epochs = total
+        self._emit_progress(now)
 
-            # 현재 Epoch 갱신 (뒤에서 진행률 계산에 사용)
-            if ep > self.current_epoch:
-                self.current_epoch = ep
-
-            # Epoch 1이 처음 보이는 시점 = 준비 끝/학습 시작 지점으로 간주
-            if ep == 1 and self._first_epoch_seen_time is None:
-                self._first_epoch_seen_time = now
-                if self._prepare_end_time is None:
-                    self._prepare_end_time = now
-
-            # Epoch 2 이상이 처음 보이는 시점 = Epoch 1 종료 시점으로 간주
-            if ep >= 2 and self._epoch1_end_time is None:
-                self._epoch1_end_time = now
-                # 혹시라도 prepare_end_time이 비어있다면 첫 epoch 등장 시각 기준으로 보정
-                if self._prepare_end_time is None:
-                    self._prepare_end_time = self._first_epoch_seen_time or self._start_time or now
-
-                # 🔥 예상 총 학습시간 계산 (보수적으로)
-                if self._start_time is not None and self._prepare_end_time is not None:
-                    t_prepare = self._prepare_end_time - self._start_time
+    # --------------------------------------------------
+    # 🔥 Epoch 시작 (자식 프로세스의 on_train_epoch_start 콜백에서 전달)
+    #   - 로그 파싱 없이 trainer 상태에서 Epoch 정보를 바로 읽음
+    #   - 직전 Epoch 소요시간으로 EWMA 갱신
+    #   - 예상 총 학습시간을 매 Epoch 다시 계산
+    # --------------------------------------------------
+    def _on_epoch_start(self, ep: int, total: int):
+        now = time.monotonic()
+        if self._start_time is None:
+            self._start_time = now
+
+        # 총 Epoch 정보 업데이트 (YOLO 설정과 다를 일은 거의 없지만 방어용)
+        if total > 0:
+            self.total_epochs = total
+
+        if ep > self.current_epoch:
+            # 직전 Epoch 소요시간 → EWMA
+            #   (1에포크는 warmup 때문에 느림 → 이후 Epoch 측정값으로 점점 보정)
+            if self._epoch_start_time is not None:
+                dt = now - self._epoch_start_time
+                if self._epoch_ewma is None:
+                    self._epoch_ewma = dt
                 else:
-                    t_prepare = 0.0
-                t_epoch1 = self._epoch1_end_time - (self._prepare_end_time or self._start_time or self._epoch1_end_time)
+                    self._epoch_ewma = _ETA_ALPHA * dt + (1 - _ETA_ALPHA) * self._epoch_ewma
 
-                # 기본 공식: 준비시간 + (1 Epoch 순수 학습시간 × 총 Epoch 수)
-                expected_total = t_prepare + max(t_epoch1, 0.1) * self.total_epochs
-                self._expected_total_time = expected_total
+                # 🔥 예상 총 학습시간 = 지금까지 경과 + EWMA × 남은 Epoch 수(현재 포함)
+                remaining = max(self.total_epochs - ep + 1, 0)
+                first_estimate = self._expected_total_time is None
+                self._expected_total_time = (now - self._start_time) + max(self._epoch_ewma, 0.1) * remaining
 
                 # 로그에 한 번 안내
-                self.log_signal.emit(
-                    f"⏳ 1에포크 기준 예상 총 학습시간: 약 {format_time(expected_total)}"
-                )
+                if first_estimate:
+                    self.log_signal.emit(
+                        f"⏳ 1에포크 기준 예상 총 학습시간: 약 {format_time(self._expected_total_time)}"
+                    )
+
+            # 현재 Epoch 갱신 (뒤에서 진행률 계산에 사용)
+            self.current_epoch = ep
+            self._epoch_start_time = now
 
-        # 매 로그마다 진행률 업데이트
         self._emit_progress(now)
 
     # --------------------------------------------------
-    # 🔥 진행률/ETA 시그널 발행
+    # 🔥 진행률/ETA 시그널 발행 (로그/Epoch마다 호출되는 경로)
+    # --------------------------------------------------
+    def _emit_progress(self, now: float):
+        if self._start_time is None:
+            return
+
+        # 100ms 안에 다시 들어온 갱신은 건너뜀
+        if now - self._last_emit_ts < 0.1:
+            return
+
+        elapsed = now - self._start_time
+        progress, expected = self._calc_progress(elapsed, self._expected_total_time)
+
+        # 퍼센트/Epoch가 그대로면 경과시간 표시용으로 1초에 한 번만 전송
+        state = (progress, self.current_epoch)
+        if state == self._last_emitted and now - self._last_emit_ts < 1.0:
+            return
+        self._last_emitted = state
+        self._last_emit_ts = now
+
+        # UI 쪽에서 퍼센트는 다시 계산할 수 있게, 여기선 시간/epoch 정보만 보냄
+        self._emit_progress_sig(elapsed, expected, self.current_epoch, self.total_epochs)
+
+    # --------------------------------------------------
+    # 🔥 학습 종료 후 post-processing 중: 강제로 100% 맞춰서 1회 전송
     # --------------------------------------------------
-    def _emit_progress(self, now: float | None = None, force_done: bool = False):
-        if now is None:
-            now = time.time()
+    def _emit_progress_done(self):
         if self._start_time is None:
             return
 
+        now = time.monotonic()
         elapsed = now - self._start_time
         expected = self._expected_total_time
+        if expected is None or expected < elapsed:
+            expected = elapsed
+        self._expected_total_time = expected
 
-        # 학습이 모두 끝난 뒤 post-processing 중일 때 강제로 100% 맞춰주기
-        if force_done:
-            if expected is None or expected < elapsed:
-                expected = elapsed
-            self._expected_total_time = expected
+        progress, expected = self._calc_progress(elapsed, expected)
+        self._last_emitted = (progress, self.current_epoch)
+        self._last_emit_ts = now
+        self._emit_progress_sig(elapsed, expected, self.current_epoch, self.total_epochs)
 
+    def _calc_progress(self, elapsed: float, expected: float | None):
         # 예상 시간이 아직 없으면, Epoch 비율로만 대략 진행률 표시
         if not expected or expected <= 0:
             if self.total_epochs > 0:
                 frac = min(1.0, self.current_epoch / float(self.total_epochs))
-                progress = int(frac * 100)
-            else:
-                progress = 0
-            expected = 0.0
-        else:
-            progress = int(min(100, (elapsed / expected) * 100))
-
-        # UI 쪽에서 퍼센트는 다시 계산할 수 있게, 여기선 시간/epoch 정보만 보냄
-        self.progress_signal.emit(elapsed, expected, self.current_epoch, self.total_epochs)
+                return int(frac * 100), 0.0
+            return 0, 0.0
+        return int(min(100, (elapsed / expected) * 100)), expected
 
     def run(self):
         timestamp = datetime.datetime.now().strftime("%y%m%d_%H%M")
@@ -200,9 +499,15 @@ class TrainWorker(QThread):
         models_dir = self.paths["models_dir"]
         history_dir = self.paths["history_dir"]
 
-        os.makedirs(runs_dir, exist_ok=True)
-        os.makedirs(models_dir, exist_ok=True)
-        os.makedirs(history_dir, exist_ok=True)
+        for d in (runs_dir, models_dir, history_dir):
+            os.makedirs(d, exist_ok=True)
+
+        # 결과 경로는 미리 계산 (학습 후 블록은 지역변수만 사용)
+        run_name = f"train_{timestamp}"
+        run_dir = os.path.join(runs_dir, run_name)
+        best_src = os.path.join(run_dir, "weights", "best.pt")
+        best_dst = os.path.join(models_dir, f"best_{timestamp}.pt")
+        hist_dir = os.path.join(history_dir, timestamp)
 
         # -------------------------
         # 로그 시작
@@ -211,101 +516,128 @@ class TrainWorker(QThread):
         self.log_signal.emit(f"data.yaml: {self.data_yaml}")
         self.log_signal.emit(f"선택한 dataset 카테고리: {self.dataset_name}")
 
-        # stdout redirect
-        class Redirect(io.TextIOBase):
-            def __init__(self, callback, owner: "TrainWorker"):
-                self.callback = callback
-                self.buffer = ""
-                self.owner = owner
-
-            def write(self, text):
-                self.buffer += text
-                while "\n" in self.buffer:
-                    line, self.buffer = self.buffer.split("\n", 1)
-                    line = line.rstrip("\r")
-                    if line.strip():
-                        # 1) 로그 출력
-                        self.callback(line.strip())
-                        # 2) ETA/진행률 갱신
-                        self.owner._handle_log_line(line.strip())
-                return len(text)
-
-            def flush(self):
-                if self.buffer.strip():
-                    self.callback(self.buffer.strip())
-                    self.owner._handle_log_line(self.buffer.strip())
-                    self.buffer = ""
-
-        old_stdout, old_stderr = sys.stdout, sys.stderr
-        sys.stdout = Redirect(self.log_signal.emit, self)
-        sys.stderr = Redirect(self.log_signal.emit, self)
-
         # -------------------------
         # Device
         # -------------------------
-        try:
-            import torch
-            device = "0" if torch.cuda.is_available() else "cpu"
-            self.log_signal.emit(f"Device: {device}")
-        except:
-            device = "cpu"
-            self.log_signal.emit("CUDA 체크 실패 → CPU 사용")
+        device = pick_device()
+        self.log_signal.emit(f"Device: {device}")
+
+        # DataLoader worker 수 (최대 8)
+        #   - Ultralytics InfiniteDataLoader는 epoch 간 worker를 재사용하므로
+        #     persistent_workers를 따로 줄 필요 없음 (pin_memory도 기본 ON)
+        workers = min(8, os.cpu_count() or 4)
+
+        # AMP는 CUDA에서만 실제로 적용됨 (cpu/mps에선 Ultralytics가 끔)
+        amp = self.use_amp and device == "0"
+        if self.use_amp and not amp:
+            self.log_signal.emit(f"⚠ {device}에서는 AMP 미지원 → OFF")
+        self.log_signal.emit(
+            f"AMP: {'ON' if amp else 'OFF'} | workers: {workers} (epoch 간 재사용)"
+        )
+
+        # auto-batch는 CUDA에서만 의미 있음 → 그 외 device는 기본값 8
+        batch = self.batch
+        if batch == -1 and device != "0":
+            batch = 8
+        self.log_signal.emit(f"imgsz: {self.imgsz} | batch: {'auto' if batch == -1 else batch}")
 
         # -------------------------
         # Train 실행
         # -------------------------
-        start_time = time.time()
+        start_time = time.monotonic()
         self._start_time = start_time  # 진행률 계산에 사용
 
-        model = YOLO(self.model_name)
-
         try:
-            results = model.train(
-                data=self.data_yaml,
-                epochs=self.epochs,
-                patience=self.patience,
-                imgsz=640,
-                batch=8,
-                device=device,
-                project=runs_dir,
-                name=f"train_{timestamp}",
-                save=True,
-                exist_ok=True
-            )
+            weights = _resolve_base_weights(self.model_name, models_dir)
+            if not os.path.isfile(weights):
+                # 캐시된 파일이 지워진 경우 다시 받기
+                _resolve_base_weights.cache_clear()
+                weights = _resolve_base_weights(self.model_name, models_dir)
         except Exception as e:
-            self.log_signal.emit(f"❌ 학습 실패: {e}")
-            sys.stdout, sys.stderr = old_stdout, old_stderr
-            return
+            self.log_signal.emit(f"⚠ 기본 가중치 캐시 실패 → {self.model_name} 직접 로드 ({e})")
+            weights = self.model_name
+
+        train_kwargs = dict(
+            data=self.data_yaml,
+            epochs=self.epochs,
+            patience=self.patience,
+            imgsz=self.imgsz,
+            batch=batch,
+            device=device,
+            amp=self.use_amp,      # GradScaler는 Ultralytics 내부에서 처리
+            workers=workers,
+            project=runs_dir,
+            name=run_name,
+            save=True,
+            exist_ok=True,
+            verbose=False
+        )
+
+        # 학습은 spawn 자식 프로세스에서 (stdout 대신 콜백 메시지로 로그/진행률 수신)
+        ctx = mp.get_context("spawn")
+        q = ctx.Queue()
+        proc = ctx.Process(
+            target=_train_entry,
+            args=(weights, train_kwargs, q)
+        )
+        proc.start()
+        cleanup = functools.partial(_terminate_if_alive, proc)
+        atexit.register(cleanup)
+
+        map50 = None
+        ok = False
+        q_get = q.get
+        log_append = self._log_buf.append
+        on_log = self._on_log_written
+        try:
+            while True:
+                try:
+                    msg = q_get(timeout=0.5)
+                except queue.Empty:
+                    if proc.is_alive():
+                        on_log()  # 메시지가 없어도 경과시간 표시는 계속 갱신
+                        continue
+                    # 종료 직후 큐에 남은 메시지가 있을 수 있으므로 한 번 더 확인
+                    try:
+                        msg = q_get(timeout=1.0)
+                    except queue.Empty:
+                        self.log_signal.emit(f"❌ 학습 프로세스 비정상 종료 (exit code {proc.exitcode})")
+                        break
+
+                kind = msg[0]
+                if kind == "tick":
+                    on_log()
+                elif kind == "log":
+                    log_append(msg[1])
+                    on_log()
+                elif kind == "epoch":
+                    self._on_epoch_start(msg[1], msg[2])
+                elif kind == "batch":
+                    if batch == -1:
+                        self.log_signal.emit(f"AutoBatch → batch: {msg[1]}")
+                    batch = msg[1]
+                elif kind == "error":
+                    self.log_signal.emit(f"❌ 학습 실패: {msg[1]}")
+                    break
+                elif kind == "done":
+                    map50 = msg[1]
+                    ok = True
+                    break
         finally:
-            sys.stdout, sys.stderr = old_stdout, old_stderr
+            proc.join(timeout=10)
+            _terminate_if_alive(proc)
+            atexit.unregister(cleanup)
+
+        if not ok:
+            return
 
         # 🔥 학습 루프는 끝났지만, 아직 파일 복사/메타 저장 작업이 남아있으므로
         # 여기서 한 번 더 "100% 근처"로 진행률 보정
-        self._emit_progress(now=time.time(), force_done=True)
+        self._emit_progress_done()
 
         # -------------------------
         # mAP50 계산
         # -------------------------
-        def get_map50(res):
-            try:
-                if hasattr(res.metrics, "map50"):
-                    return float(res.metrics.map50)
-            except:
-                pass
-            try:
-                if hasattr(res.metrics, "box"):
-                    return float(res.metrics.box.map50)
-            except:
-                pass
-            try:
-                d = res.results_dict
-                if "metrics/mAP50(B)" in d:
-                    return float(d["metrics/mAP50(B)"])
-            except:
-                pass
-            return None
-
-        map50 = get_map50(results)
         if map50:
             self.log_signal.emit(f"✔ mAP50: {map50:.4f}")
         else:
@@ -314,26 +646,19 @@ class TrainWorker(QThread):
         # -------------------------
         # 시간 계산
         # -------------------------
-        end_time = time.time()
+        end_time = time.monotonic()
         train_time_sec = end_time - start_time
 
         # -------------------------
         # Best 모델 저장
         # -------------------------
-        run_dir = os.path.join(runs_dir, f"train_{timestamp}")
-        best_src = os.path.join(run_dir, "weights", "best.pt")
-
-        best_name = f"best_{timestamp}.pt"
-        best_dst = os.path.join(models_dir, best_name)
-
-        shutil.copy(best_src, best_dst)
+        _fastcopy(best_src, best_dst)
 
         # -------------------------
         # history/{timestamp}/ 저장
         # -------------------------
-        hist_dir = os.path.join(history_dir, timestamp)
         os.makedirs(hist_dir, exist_ok=True)
-        shutil.copy(best_src, os.path.join(hist_dir, "best.pt"))
+        _fastcopy(best_src, os.path.join(hist_dir, "best.pt"))
 
         # -------------------------
         # metadata.json 저장
@@ -345,14 +670,16 @@ class TrainWorker(QThread):
             "base_model": self.model_name,
             "epochs": self.epochs,
             "patience": self.patience,
+            "amp": amp,
+            "imgsz": self.imgsz,
+            "batch": batch,
             "models_file": best_dst,
             "run_dir": run_dir,
             "train_time_sec": train_time_sec,
             "map50": map50
         }
 
-        with open(os.path.join(hist_dir, "metadata.json"), "w", encoding="utf-8") as f:
-            json.dump(meta, f, indent=4, ensure_ascii=False)
+        save_json(os.path.join(hist_dir, "metadata.json"), meta)
 
         self.log_signal.emit(f"✔ 학습 완료 → {best_dst}")
         self.log_signal.emit(f"⏱ 실제 학습 시간: {format_time(train_time_sec)}")
@@ -370,6 +697,8 @@ class TrainPage(QWidget):
         self.overlay = None
         self.data_yaml = None
         self.dataset_name = "unknown"
+        self.worker = None
+        self._pending_logs: list[str] = []  # 타이머가 다음 tick에 반영할 로그
         self.update_paths(settings)
 
         layout = QVBoxLayout(self)
@@ -439,6 +768,25 @@ class TrainPage(QWidget):
         row3.addWidget(self.patience_input)
         layout.addLayout(row3)
 
+        # imgsz / batch
+        row4 = QHBoxLayout()
+        row4.addWidget(QLabel("Image Size:"))
+        self.imgsz_input = QLineEdit("640")
+        row4.addWidget(self.imgsz_input)
+        row4.addWidget(QLabel("Batch:"))
+        self.batch_input = QLineEdit("8")
+        row4.addWidget(self.batch_input)
+        self.auto_batch_check = QCheckBox("Auto (GPU 메모리 기준)")
+        self.auto_batch_check.toggled.connect(lambda on: self.batch_input.setEnabled(not on))
+        self.auto_batch_check.setChecked(True)
+        row4.addWidget(self.auto_batch_check)
+        layout.addLayout(row4)
+
+        # AMP (Mixed Precision)
+        self.amp_check = QCheckBox("AMP (Mixed Precision) 사용")
+        self.amp_check.setChecked(True)
+        layout.addWidget(self.amp_check)
+
         # 🔥 진행률 ProgressBar + 상태 라벨
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
@@ -458,8 +806,14 @@ class TrainPage(QWidget):
         self.log_box = QTextEdit()
         self.log_box.setReadOnly(True)
         self.log_box.setStyleSheet("font-family:Consolas; font-size:12px;")
+        self.log_box.document().setMaximumBlockCount(2000)  # 오래된 줄은 버림
         layout.addWidget(self.log_box)
 
+        # 학습 로그는 100ms마다 한 번에 반영 (repaint 횟수 제한)
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(100)
+        self.log_timer.timeout.connect(self.flush_worker_logs)
+
         layout.addStretch()
 
     def set_overlay(self, overlay):
@@ -533,8 +887,10 @@ class TrainPage(QWidget):
         try:
             epochs = int(self.epoch_input.text())
             patience = int(self.patience_input.text())
+            imgsz = int(self.imgsz_input.text() or 640)
+            batch = -1 if self.auto_batch_check.isChecked() else int(self.batch_input.text())
         except ValueError:
-            self.log_box.append("❌ Epochs / Patience는 정수로 입력해주세요.")
+            self.log_box.append("❌ Epochs / Patience / Image Size / Batch는 정수로 입력해주세요.")
             return
 
         model_name = self.model_combo.currentText()
@@ -554,17 +910,46 @@ class TrainPage(QWidget):
             epochs,
             patience,
             self.paths,
-            dataset_name=self.dataset_name
+            dataset_name=self.dataset_name,
+            use_amp=self.amp_check.isChecked(),
+            imgsz=imgsz,
+            batch=batch
         )
-        self.worker.log_signal.connect(self.log_box.append)
+        self.worker.log_signal.connect(self.on_worker_log, Qt.QueuedConnection)
         self.worker.finished_ok.connect(self.on_model_saved)
         self.worker.finished.connect(self.training_done)
         # 🔥 진행률 연결
         self.worker.progress_signal.connect(self.on_progress_update)
 
         self.worker.start()
+        self.log_timer.start()
+
+    # --------------------------------------------------
+    # 🔥 worker 로그 반영
+    #   - 학습 로그(링버퍼) + 상태 메시지(log_signal)를 pending에 모았다가
+    #     타이머 tick마다 append 한 번으로 반영
+    #   - 상태 메시지가 오면 링버퍼를 먼저 옮겨서 순서 유지
+    # --------------------------------------------------
+    def _collect_worker_logs(self):
+        if self.worker is None:
+            return
+        buf = self.worker._log_buf
+        while buf:
+            self._pending_logs.append(buf.popleft())
+
+    def flush_worker_logs(self):
+        self._collect_worker_logs()
+        if self._pending_logs:
+            self.log_box.append("\n".join(self._pending_logs))
+            self._pending_logs.clear()
+
+    def on_worker_log(self, message: str):
+        self._collect_worker_logs()
+        self._pending_logs.append(message)
 
     def training_done(self):
+        self.log_timer.stop()
+        self.flush_worker_logs()
         if self.overlay:
             self.overlay.hide_overlay()
         self.btn_start.setEnabled(True)
@@ -575,5 +960,6 @@ class TrainPage(QWidget):
             self.progress_bar.setValue(100)
 
     def on_model_saved(self, path: str):
+        self.flush_worker_logs()
         self.model_saved_signal.emit(path)
         self.log_box.append(f"✔ 모델 저장완료! : {path}")
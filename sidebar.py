@@ -1,9 +1,43 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton
-from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QButtonGroup
+from PySide6.QtCore import Signal, QTimer
+
+
+# 사이드바 메뉴
+MENU_ITEMS = (
+    "🏠 Dashboard",
+    "📚 History",
+    "📈 Model Graph",
+    "📁 Dataset",
+    "🧪 Train",
+    "🔍 Predict",
+)
+
+# 버튼 공통 스타일 (활성 버튼은 active 속성 선택자로 구분)
+DEFAULT_QSS = """
+    QPushButton {
+        background-color: #E9E9E9;
+        border: 1px solid #CCCCCC;
+        padding: 8px;
+        font-size: 14px;
+        text-align: left;
+        border-radius: 6px;
+    }
+    QPushButton:hover {
+        background-color: #F5F5F5;
+    }
+    QPushButton[active="true"] {
+        background-color: #A7D8FF;
+        border: 1px solid #6BB6FF;
+    }
+    QPushButton[active="true"]:hover {
+        background-color: #9CD0FF;
+    }
+"""
 
 
 class Sidebar(QWidget):
-    menu_clicked = Signal(int)
+    # (index, first_time) — first_time이면 받는 쪽에서 페이지를 처음 생성하면 됨
+    menu_clicked = Signal(int, bool)
 
     def __init__(self):
         super().__init__()
@@ -12,78 +46,68 @@ class Sidebar(QWidget):
         layout.setSpacing(6)
         layout.setContentsMargins(10, 10, 10, 10)
 
-        self.buttons = []
+        btns = []
 
-        # 사이드바 메뉴
-        menu_list = [
-            "🏠 Dashboard",
-            "📚 History",
-            "📈 Model Graph",
-            "📁 Dataset",
-            "🧪 Train",
-            "🔍 Predict",
-        ]
+        # 스타일시트는 한 번만 설치, 활성 상태는 동적 속성(active)으로 구분
+        self.setStyleSheet(DEFAULT_QSS)
 
-        for index, text in enumerate(menu_list):
+        # 버튼별 lambda 대신 그룹 하나로 클릭 index 전달 (exclusive → 이전 버튼 자동 해제)
+        self.group = QButtonGroup(self)
+        self.group.setExclusive(True)
+
+        for index, text in enumerate(MENU_ITEMS):
             btn = QPushButton(text)
             btn.setCheckable(True)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #E9E9E9;
-                    border: 1px solid #CCCCCC;
-                    padding: 8px;
-                    font-size: 14px;
-                    text-align: left;
-                    border-radius: 6px;
-                }
-                QPushButton:hover {
-                    background-color: #F5F5F5;
-                }
-            """)
-            btn.clicked.connect(lambda checked, i=index: self.on_button_clicked(i))
-            self.buttons.append(btn)
+            btn.setProperty("active", False)
+            self.group.addButton(btn, index)
+            btns.append(btn)
             layout.addWidget(btn)
 
+        # 메뉴 개수는 고정 → tuple로 보관
+        self.buttons = tuple(btns)
+
+        self.group.idClicked.connect(self.on_button_clicked)
+
         layout.addStretch()
         self.current_index = None
+        self._visited: set[int] = set()
+        self._pending_index = None  # 같은 이벤트 루프 tick 안의 마지막 클릭
 
     # ================================
     def on_button_clicked(self, index: int):
+        # 연속 클릭은 다음 이벤트 루프 tick에 마지막 것만 처리
+        if self._pending_index is None:
+            QTimer.singleShot(0, self._flush_click)
+        self._pending_index = index
+
+    def _flush_click(self):
+        index = self._pending_index
+        self._pending_index = None
+        if index is None:
+            return
+
         self.set_active(index)
-        self.menu_clicked.emit(index)
+        first_time = index not in self._visited
+        self._visited.add(index)
+        self.menu_clicked.emit(index, first_time)
 
     # ================================
     def set_active(self, index: int):
-        for i, btn in enumerate(self.buttons):
-            if i == index:
-                btn.setChecked(True)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #A7D8FF;
-                        border: 1px solid #6BB6FF;
-                        padding: 8px;
-                        font-size: 14px;
-                        text-align: left;
-                        border-radius: 6px;
-                    }
-                    QPushButton:hover {
-                        background-color: #9CD0FF;
-                    }
-                """)
-            else:
-                btn.setChecked(False)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #E9E9E9;
-                        border: 1px solid #CCCCCC;
-                        padding: 8px;
-                        font-size: 14px;
-                        text-align: left;
-                        border-radius: 6px;
-                    }
-                    QPushButton:hover {
-                        background-color: #F5F5F5;
-                    }
-                """)
+        # 이미 활성인 메뉴를 다시 누른 경우 할 일 없음
+        prev = self.current_index
+        if prev == index:
+            return
+
+        # 상태가 바뀌는 버튼(이전 활성 / 새 활성)만 다시 polish
+        if prev is not None:
+            self._set_button_active(self.buttons[prev], False)
+        self._set_button_active(self.buttons[index], True)
 
         self.current_index = index
+
+    def _set_button_active(self, btn: QPushButton, active: bool):
+        btn.setChecked(active)
+        btn.setProperty("active", active)
+        # 속성 변경 후 재polish해야 QSS 선택자가 다시 적용됨
+        btn.style().unpolish(btn)
+        btn.style().polish(btn)
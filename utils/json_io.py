@@ -0,0 +1,21 @@
+# utils/json_io.py
+
+import json
+
+try:
+    import orjson  # 선택 의존성: 있으면 C 구현으로 한 번에 직렬화
+except ImportError:
+    orjson = None
+
+
+def save_json(path, data):
+    """
+    metadata 류 dict를 JSON 파일로 저장.
+    orjson이 있으면 bytes로 직렬화해서 write 1회, 없으면 표준 json 사용.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
@@ -1,17 +1,34 @@
 # utils/model_loader.py
 
 import os
+import functools
+
+
+# 대소문자 조합을 모두 나열 → 항목마다 lower()로 새 문자열 만들지 않음
+_PT_SUFFIXES = (".pt", ".PT", ".Pt", ".pT")
+
+
+@functools.lru_cache(maxsize=8)
+def _listing(models_dir, mtime_ns):
+    # scandir은 dirent 타입을 같이 주므로 항목마다 stat 하지 않음
+    # 한 번 순회로 거르고, 그 리스트를 제자리 정렬
+    with os.scandir(models_dir) as it:
+        names = [
+            e.name for e in it
+            if e.name.endswith(_PT_SUFFIXES) and e.is_file(follow_symlinks=False)
+        ]
+    names.sort()
+    return tuple(names)
 
 
 def load_model_list(models_dir="models"):
     """
-    models 폴더에서 .pt 파일을 찾아 정렬된 리스트로 반환.
+    models 폴더에서 .pt 파일을 찾아 정렬된 tuple로 반환.
     Predict 페이지에서 사용.
+    폴더 mtime이 그대로면 stat 1회로 이전 결과를 그대로 공유.
     """
-    if not os.path.exists(models_dir):
-        return []
-
-    files = os.listdir(models_dir)
-    pt_files = [f for f in files if f.lower().endswith(".pt")]
-    pt_files.sort()
-    return pt_files
+    try:
+        mtime_ns = os.stat(models_dir).st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    return _listing(models_dir, mtime_ns)
@@ -1,14 +1,33 @@
 import os
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
-from PySide6.QtGui import QMovie
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout
+from PySide6.QtGui import QMovie, QPainter, QColor
+from PySide6.QtCore import Qt, QSize, QEvent, QTimer
+
+
+# 오버레이 배경 (검정 + 반투명)
+_DIM_COLOR = QColor(0, 0, 0, 140)
 
 
 class LoadingOverlay(QWidget):
+    @classmethod
+    def instance(cls, parent=None):
+        """
+        앱 전체에서 하나만 쓰는 오버레이 (QApplication에 보관).
+        처음 호출할 때 parent(최상위 윈도우)에 붙여서 생성.
+        """
+        app = QApplication.instance()
+        overlay = getattr(app, "loading_overlay", None)
+        if overlay is None:
+            overlay = cls(parent)
+            app.loading_overlay = overlay
+        return overlay
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self.setStyleSheet("background-color: rgba(0, 0, 0, 140);")
+        # 반투명 배경은 QSS 대신 paintEvent에서 직접 채움 (배경 지우기 단계도 생략)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.hide()
 
@@ -19,12 +38,16 @@ class LoadingOverlay(QWidget):
         self.gif_label = QLabel()
         self.gif_label.setAlignment(Qt.AlignCenter)
 
-        gif_path = os.path.abspath("resources/fast-run.gif")
-        if os.path.exists(gif_path):
-            self.movie = QMovie(gif_path)
-            self.movie.setScaledSize(QSize(120, 120))  # 크기 줄이기
-            self.gif_label.setMovie(self.movie)
-        else:
+        # QMovie는 처음 show_overlay 때 생성 (한 번도 안 띄우면 GIF 디코딩 안 함)
+        self._gif_path = os.path.abspath("resources/fast-run.gif")
+        self.movie = None
+
+        # GIF 프레임은 CoarseTimer로 직접 넘김 (장식용이라 정밀 타이머 불필요 → wakeup 감소)
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setTimerType(Qt.CoarseTimer)
+        self._frame_timer.setInterval(80)
+        self._frame_timer.timeout.connect(self._next_frame)
+        if not os.path.exists(self._gif_path):
             self.gif_label.setText("fast-run.gif 없음")
 
         # 텍스트
@@ -32,18 +55,44 @@ class LoadingOverlay(QWidget):
         self.text_label.setAlignment(Qt.AlignCenter)
         self.text_label.setStyleSheet("color:white; font-size:18px; font-weight:bold;")
 
+        # 라벨은 클릭을 받을 일이 없음
+        self.gif_label.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.text_label.setAttribute(Qt.WA_TransparentForMouseEvents)
+
         layout.addWidget(self.gif_label)
         layout.addWidget(self.text_label)
 
+        # 부모 크기를 따라가도록 resize 이벤트만 받아서 맞춤 (show마다 setGeometry 안 함)
+        if parent is not None:
+            parent.installEventFilter(self)
+            self.resize(parent.size())
+
+    def eventFilter(self, obj, event):
+        if obj is self.parent() and event.type() == QEvent.Resize:
+            self.resize(obj.size())
+        return super().eventFilter(obj, event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), _DIM_COLOR)
+        painter.end()
+
     def show_overlay(self, message: str = "작업 중..."):
         self.text_label.setText(message)
-        if self.parent():
-            self.setGeometry(self.parent().rect())
         self.show()
-        if hasattr(self, "movie"):
-            self.movie.start()
+        if self.movie is None and os.path.exists(self._gif_path):
+            self.movie = QMovie(self._gif_path)
+            self.movie.setCacheMode(QMovie.CacheAll)   # 프레임은 한 번만 디코딩
+            self.movie.setScaledSize(QSize(120, 120))  # 크기 줄이기
+            self.gif_label.setMovie(self.movie)
+            self.movie.jumpToFrame(0)
+        if self.movie is not None:
+            self._frame_timer.start()  # 숨길 때 멈춘 프레임부터 이어서 재생
 
     def hide_overlay(self):
         self.hide()
-        if hasattr(self, "movie"):
-            self.movie.stop()
+        self._frame_timer.stop()  # 현재 프레임 그대로 멈춤
+
+    def _next_frame(self):
+        if not self.movie.jumpToNextFrame():
+            self.movie.jumpToFrame(0)  # 마지막 프레임 → 처음부터 반복